@@ -1,12 +1,10 @@
+import importlib.util
+
 from flask import Flask, render_template_string
-import pandas as pd
 
-# Optional: try to use a Hugging Face dataset if the 'datasets' library is installed
-try:
-    from datasets import load_dataset
-    HF_AVAILABLE = True
-except ImportError:
-    HF_AVAILABLE = False
+# Optional: use a Hugging Face dataset if the 'datasets' library is installed.
+# We only check that it exists here; the (slow) import happens on first request.
+HF_AVAILABLE = importlib.util.find_spec("datasets") is not None
 
 app = Flask(__name__)
 
@@ -28,6 +26,8 @@ def get_example_hf_dataframe():
         return None, "The 'datasets' library is not installed. Run: pip install datasets"
 
     try:
+        from datasets import load_dataset
+
         # Example dataset – students can replace with an environmental dataset they like.
         # For class use, pick a small, public dataset such as 'climate_fever'.
         ds = load_dataset("climate_fever", split="train").select(range(10))
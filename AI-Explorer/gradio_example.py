@@ -1,9 +1,11 @@
 import gradio as gr
-import plotly.express as px
-import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
 
+# plotly is only needed to draw the charts, so it is imported inside the
+# functions below. (gradio already loads pandas and numpy when it is imported,
+# so there is nothing to gain by deferring those.)
+
 # -----------------------------------------------------
 # Placeholder ML model functions (students replace later)
 # -----------------------------------------------------
@@ -14,6 +16,8 @@ def dummy_predict_price(start_date, end_date, ticker):
     Currently generates random walk time-series.
     Students can replace with real ML model.
     """
+    import plotly.express as px
+
     dates = pd.date_range(start=start_date, end=end_date, freq="D")
     values = np.cumsum(np.random.randn(len(dates))) + 100  # random walk
     
@@ -27,6 +31,8 @@ def dummy_candlestick(start_date, end_date):
     """
     Another placeholder plot (fake candlestick).
     """
+    import plotly.graph_objects as go
+
     dates = pd.date_range(start=start_date, end=end_date, freq="D")
     open_vals = np.random.uniform(90, 110, len(dates))
     close_vals = open_vals + np.random.normal(0, 2, len(dates))
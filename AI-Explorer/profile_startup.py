@@ -0,0 +1,224 @@
+"""
+Startup import profiler for the AI-Explorer apps.
+
+For each app, this script finds the imports that run when the file is loaded
+(not the ones inside functions), imports them in a fresh Python process with
+`python -X importtime`, and prints how long each one took.
+
+Usage:
+    python profile_startup.py                      # profile every app
+    python profile_startup.py gradio_example.py    # profile one app
+    python profile_startup.py --budget-ms 1500     # exit 1 if any app is slower
+
+The script exits with status 1 if any import fails for a reason other than
+the module not being installed (for example, an installed package whose own
+dependency is missing). With --budget-ms it also exits 1 if a load-time
+import is not installed, because then the app's startup cost cannot be
+measured.
+"""
+
+import argparse
+import ast
+import os
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+APPS = [
+    "streamlit_app.py",
+    "gradio_example.py",
+    "costal_dashboard.py",
+]
+
+MARKER = "--- profile_startup: app imports start ---"
+MISSING_PREFIX = "profile_startup: missing "
+FAILED_PREFIX = "profile_startup: failed "
+
+
+# -------------------------------------------------------------------
+# Find the imports an app runs at load time
+# -------------------------------------------------------------------
+def module_level_imports(path):
+    """
+    Returns the module names imported at the top level of `path`, in order.
+    Imports inside functions and classes are skipped, because they only
+    run when that code is called.
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    modules = []
+
+    def visit(node):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)):
+            return
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                modules.append(alias.name)
+        elif isinstance(node, ast.ImportFrom):
+            if node.module and node.level == 0:
+                modules.append(node.module)
+        for child in ast.iter_child_nodes(node):
+            visit(child)
+
+    visit(tree)
+
+    # Keep the first occurrence of each module
+    return list(dict.fromkeys(modules))
+
+
+# -------------------------------------------------------------------
+# Run `python -X importtime` and read its report
+# -------------------------------------------------------------------
+def build_import_script(modules):
+    """
+    Returns Python code that prints a marker and then imports each module.
+    Everything Python imports for itself at startup is printed before the marker.
+    An import that fails is reported and the remaining imports still run.
+    A module only counts as missing if it, or a package it lives in, cannot be
+    found. Any other error, including an ImportError raised from inside an
+    installed package, is reported as a failure.
+    """
+    lines = [
+        "import sys",
+        "def _not_installed(name, e):",
+        "    return e.name is not None and (name == e.name or name.startswith(e.name + '.'))",
+        f"sys.stderr.write({MARKER!r} + '\\n')",
+        "sys.stderr.flush()",
+    ]
+    for name in modules:
+        lines += [
+            "try:",
+            f"    import {name}",
+            "except Exception as e:",
+            f"    if isinstance(e, ModuleNotFoundError) and _not_installed({name!r}, e):",
+            f"        sys.stderr.write({MISSING_PREFIX!r} + {name!r} + '\\n')",
+            "    else:",
+            f"        sys.stderr.write({FAILED_PREFIX!r} + {name!r} + ': ' + repr(e) + '\\n')",
+        ]
+    return "\n".join(lines)
+
+
+def parse_importtime(stderr):
+    """
+    Parses `-X importtime` output written after the marker.
+    Returns (top_level, missing, failed): top_level is a list of
+    (module, self_us, cumulative_us) for the imports the app asked for directly,
+    missing lists modules that are not installed, and failed lists
+    "module: error" strings for imports that raised anything else.
+    """
+    lines = stderr.splitlines()
+    if MARKER in lines:
+        lines = lines[lines.index(MARKER) + 1:]
+
+    entries = []
+    missing = []
+    failed = []
+    for line in lines:
+        if line.startswith(MISSING_PREFIX):
+            missing.append(line[len(MISSING_PREFIX):])
+            continue
+        if line.startswith(FAILED_PREFIX):
+            failed.append(line[len(FAILED_PREFIX):])
+            continue
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header row
+        name_field = fields[2]
+        depth = len(name_field) - len(name_field.lstrip())
+        entries.append((depth, name_field.strip(), int(fields[0]), int(fields[1])))
+
+    if not entries:
+        return [], missing, failed
+
+    # The least-indented rows are the imports made by the app itself.
+    # Imports that did not finish are left out of the timings.
+    not_loaded = set(missing) | {error.split(":", 1)[0] for error in failed}
+    top_depth = min(depth for depth, _, _, _ in entries)
+    top_level = [(name, self_us, cum_us) for depth, name, self_us, cum_us in entries
+                 if depth == top_depth and name not in not_loaded]
+    return top_level, missing, failed
+
+
+def profile_app(path):
+    """
+    Imports the app's load-time dependencies in a fresh interpreter, run from
+    the app's own folder so its local modules can be found.
+    Returns (modules, top_level, missing, failed).
+    """
+    modules = module_level_imports(path)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", build_import_script(modules)],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(path),
+    )
+    top_level, missing, failed = parse_importtime(result.stderr)
+    if result.returncode != 0:
+        tail = "\n".join(result.stderr.splitlines()[-5:])
+        failed.append(f"profiler process exited with status {result.returncode}:\n{tail}")
+    return modules, top_level, missing, failed
+
+
+# -------------------------------------------------------------------
+# Report
+# -------------------------------------------------------------------
+def print_report(app, modules, top_level, missing, failed):
+    total_ms = sum(cum_us for _, _, cum_us in top_level) / 1000
+
+    print(f"\n{app}")
+    print("-" * len(app))
+    print(f"Load-time imports: {', '.join(modules) or '(none)'}")
+    print(f"{'module':<40} {'self ms':>10} {'total ms':>10}")
+    for name, self_us, cum_us in sorted(top_level, key=lambda row: row[2], reverse=True):
+        print(f"{name:<40} {self_us / 1000:>10.1f} {cum_us / 1000:>10.1f}")
+    print(f"{'TOTAL':<40} {'':>10} {total_ms:>10.1f}")
+    if missing:
+        print(f"Not installed (not counted): {', '.join(missing)}")
+    for error in failed:
+        print(f"FAILED: {error}")
+
+    return total_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile import time of the AI-Explorer apps.")
+    parser.add_argument("apps", nargs="*",
+                        help="App files to profile (default: all AI-Explorer apps)")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="Exit with status 1 if any app's import time exceeds this, "
+                             "or if any of its imports are not installed")
+    args = parser.parse_args()
+
+    # Paths given on the command line are relative to where you run the script;
+    # the default app list lives next to this file.
+    if args.apps:
+        paths = [os.path.abspath(app) for app in args.apps]
+    else:
+        paths = [os.path.join(HERE, app) for app in APPS]
+
+    problems = []
+    for app, path in zip(args.apps or APPS, paths):
+        modules, top_level, missing, failed = profile_app(path)
+        total_ms = print_report(app, modules, top_level, missing, failed)
+        if failed:
+            problems.append(f"{app}: {len(failed)} import(s) failed")
+        if args.budget_ms is None:
+            continue
+        if missing:
+            problems.append(f"{app}: cannot check budget, not installed: {', '.join(missing)}")
+        elif total_ms > args.budget_ms:
+            problems.append(f"{app}: took {total_ms:.1f} ms (budget {args.budget_ms:.1f} ms)")
+
+    if problems:
+        print()
+        for problem in problems:
+            print(problem)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
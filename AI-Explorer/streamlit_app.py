@@ -3,7 +3,6 @@ import pandas as pd
 import plotly.express as px
 import seaborn as sns
 import matplotlib.pyplot as plt
-import numpy as np
 
 # -------------------------------------------------------------------
 # Example Streamlit App for Students: Sleep Data Exploration Dashboard
@@ -0,0 +1,130 @@
+"""
+Checks for profile_startup.py. Run with: python -m pytest AI-Explorer
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import profile_startup
+from profile_startup import (
+    build_import_script,
+    module_level_imports,
+    parse_importtime,
+)
+
+# Real output of `python -X importtime` (Python 3.11) running the script that
+# build_import_script(["json", "json.nope", "broken", "boom", "csv"]) produces,
+# where broken.py runs `import not_a_real_module_xyz` and boom.py raises
+# RuntimeError. Only Python's own startup rows before the marker are trimmed;
+# those must be ignored.
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       236 |        236 |   _io
+import time:        44 |         44 |   marshal
+import time:       515 |        515 |   posix
+--- profile_startup: app imports start ---
+import time:       434 |        434 |         types
+import time:       117 |        117 |           _operator
+import time:       596 |        713 |         operator
+import time:       293 |        293 |             itertools
+import time:       219 |        219 |             keyword
+import time:       263 |        263 |             reprlib
+import time:       114 |        114 |             _collections
+import time:      1456 |       2343 |           collections
+import time:        93 |         93 |           _functools
+import time:       877 |       3312 |         functools
+import time:      2209 |       6666 |       enum
+import time:       112 |        112 |         _sre
+import time:      1416 |       1416 |           re._constants
+import time:       575 |       1991 |         re._parser
+import time:       201 |        201 |         re._casefix
+import time:       534 |       2837 |       re._compiler
+import time:       271 |        271 |       copyreg
+import time:       798 |      10570 |     re
+import time:       279 |        279 |       _json
+import time:       691 |        969 |     json.scanner
+import time:       655 |      12193 |   json.decoder
+import time:       774 |        774 |   json.encoder
+import time:       523 |      13489 | json
+import time:        74 |         74 | json.nope
+profile_startup: missing json.nope
+import time:       140 |        140 |   not_a_real_module_xyz
+import time:      3150 |       3290 | broken
+profile_startup: failed broken: ModuleNotFoundError("No module named 'not_a_real_module_xyz'")
+import time:       252 |        252 | boom
+profile_startup: failed boom: RuntimeError('boom')
+import time:       263 |        263 |   _csv
+import time:       607 |        869 | csv
+"""
+
+
+def test_parse_importtime_keeps_only_top_level_app_imports():
+    top_level, missing, failed = parse_importtime(SAMPLE)
+
+    assert top_level == [("json", 523, 13489), ("csv", 607, 869)]
+    assert missing == ["json.nope"]
+    assert failed == [
+        "broken: ModuleNotFoundError(\"No module named 'not_a_real_module_xyz'\")",
+        "boom: RuntimeError('boom')",
+    ]
+
+
+def test_parse_importtime_without_app_imports():
+    assert parse_importtime("--- profile_startup: app imports start ---\n") == ([], [], [])
+
+
+def test_module_level_imports_skips_function_bodies(tmp_path):
+    app = tmp_path / "app.py"
+    app.write_text(
+        "import os\n"
+        "from flask import Flask\n"
+        "from . import local\n"
+        "import plotly.express as px, os\n"
+        "try:\n"
+        "    import datasets\n"
+        "except ImportError:\n"
+        "    pass\n"
+        "def f():\n"
+        "    import numpy\n"
+        "class C:\n"
+        "    import pandas\n"
+    )
+
+    assert module_level_imports(str(app)) == ["os", "flask", "plotly.express", "datasets"]
+
+
+def test_build_import_script_under_importtime_end_to_end(tmp_path):
+    (tmp_path / "boom.py").write_text("raise RuntimeError('boom')\n")
+    (tmp_path / "broken.py").write_text("import not_a_real_module_xyz\n")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         build_import_script(["json", "boom", "not_a_real_module_xyz", "json.nope",
+                              "broken", "csv"])],
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+    )
+    top_level, missing, failed = parse_importtime(result.stderr)
+
+    assert result.returncode == 0
+    assert [name for name, _, _ in top_level] == ["json", "csv"]
+    assert missing == ["not_a_real_module_xyz", "json.nope"]
+    # broken.py is installed but its own dependency is not, so it is a failure
+    assert failed == [
+        "boom: RuntimeError('boom')",
+        "broken: ModuleNotFoundError(\"No module named 'not_a_real_module_xyz'\")",
+    ]
+
+
+def test_budget_fails_when_imports_are_missing(tmp_path, monkeypatch, capsys):
+    app = tmp_path / "app.py"
+    app.write_text("import json\nimport not_a_real_module_xyz\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", ["profile_startup.py", "app.py", "--budget-ms", "100000"])
+
+    with pytest.raises(SystemExit) as exc:
+        profile_startup.main()
+    assert exc.value.code == 1
+    assert "not installed: not_a_real_module_xyz" in capsys.readouterr().out